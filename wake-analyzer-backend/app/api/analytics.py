@@ -1,14 +1,19 @@
 """
 Analytics API routes - Upload, Execute, History
 """
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Set, Tuple
+from collections import OrderedDict
 import os
-import shutil
+import sys
 from datetime import datetime
+import aiofiles
+import pandas as pd
+from ulid import ULID
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.core.security import get_current_user
 from app.core.config import settings
 from app.core.schemas import (
@@ -28,6 +33,115 @@ from app.services.plan_validator import PlanValidator
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Parsed datasets kept in process memory so repeated executions against the
+# same session skip the CSV parse. Entries: session_id -> (mtime, expires_at, df)
+_DF_CACHE_SIZE = 32
+_df_cache: "OrderedDict[str, Tuple[float, datetime, pd.DataFrame]]" = OrderedDict()
+
+
+async def _save_upload(file: UploadFile, file_path: str):
+    """Stream an upload to disk in large chunks, enforcing MAX_UPLOAD_SIZE"""
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds maximum upload size of {settings.MAX_UPLOAD_SIZE} bytes"
+    )
+
+    # Large uploads are already spooled to a temp file; let the kernel copy it
+    if sys.platform.startswith("linux") and getattr(file.file, "_rolled", False):
+        in_fd = file.file.fileno()
+        size = os.fstat(in_fd).st_size
+        if size > settings.MAX_UPLOAD_SIZE:
+            raise too_large
+
+        with open(file_path, "wb") as buffer:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(buffer.fileno(), in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        return
+
+    total = 0
+    async with aiofiles.open(file_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            total += len(chunk)
+            if total > settings.MAX_UPLOAD_SIZE:
+                raise too_large
+            await buffer.write(chunk)
+
+
+def plan_columns(plan: ExecutionPlan) -> Optional[Set[str]]:
+    """
+    Columns an execution plan reads.
+
+    Returns None when the plan needs the whole dataset (heatmaps chart every
+    numeric column).
+    """
+    if plan.chart_type == 'heatmap':
+        return None
+
+    columns = {plan.target_column, plan.time_column, plan.x_axis, plan.y_axis}
+    columns |= {f.column for f in plan.filters}
+    columns |= set(plan.group_by)
+    columns.discard(None)
+    return columns
+
+
+def log_analysis(**fields):
+    """Persist an execution to the audit trail (runs after the response is sent)"""
+    db = SessionLocal()
+    try:
+        db.add(Analysis(**fields))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _remove_files(*paths: Optional[str]):
+    """Remove dataset files that exist on disk"""
+    for path in paths:
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+def _file_mtime(file_path: str) -> Optional[float]:
+    """Return file modification time, or None if the file is gone"""
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return None
+
+
+def _get_cached_dataframe(session_id: str, file_path: str) -> Optional[pd.DataFrame]:
+    """Return the cached DataFrame for a session if it is still fresh"""
+    entry = _df_cache.get(session_id)
+    if entry is None:
+        return None
+
+    mtime, expires_at, df = entry
+    expired = expires_at is not None and datetime.utcnow() >= expires_at
+    if expired or _file_mtime(file_path) != mtime:
+        _df_cache.pop(session_id, None)
+        return None
+
+    _df_cache.move_to_end(session_id)
+    return df
+
+
+def _cache_dataframe(session_id: str, file_path: str, expires_at: Optional[datetime], df: pd.DataFrame):
+    """Store a parsed DataFrame, evicting the least recently used entries"""
+    mtime = _file_mtime(file_path)
+    if mtime is None:
+        return
+
+    _df_cache[session_id] = (mtime, expires_at, df)
+    _df_cache.move_to_end(session_id)
+    while len(_df_cache) > _DF_CACHE_SIZE:
+        _df_cache.popitem(last=False)
+
 
 @router.post("/upload", response_model=DatasetUploadResponse)
 async def upload_csv(
@@ -45,22 +159,21 @@ async def upload_csv(
             detail="Only CSV files are allowed"
         )
 
-    # Generate session ID
-    session_id = f"wa_{datetime.utcnow().timestamp()}_{os.urandom(8).hex()}"
+    # Generate session ID (time-ordered, so the unique index grows at the end)
+    session_id = f"wa_{ULID()}"
 
-    # Save file
+    # Save file (plus a typed Parquet copy used for later executions)
     file_path = os.path.join(settings.UPLOAD_DIR, f"{session_id}.csv")
+    parquet_path = os.path.join(settings.UPLOAD_DIR, f"{session_id}.parquet")
 
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await _save_upload(file, file_path)
 
         # Load and analyze CSV
         engine = ExecutionEngine()
-        result = engine.load_csv(file_path)
+        result = engine.load_csv(file_path, parquet_path=parquet_path)
 
         if not result['success']:
-            os.remove(file_path)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=result['error']
@@ -72,6 +185,7 @@ async def upload_csv(
             session_id=session_id,
             filename=file.filename,
             file_path=file_path,
+            parquet_path=parquet_path,
             row_count=result['row_count'],
             column_count=len(result['columns']),
             columns=result['columns'],
@@ -80,7 +194,6 @@ async def upload_csv(
 
         db.add(dataset)
         db.commit()
-        db.refresh(dataset)
 
         return {
             'success': True,
@@ -93,10 +206,13 @@ async def upload_csv(
             }
         }
 
+    except HTTPException:
+        _remove_files(file_path, parquet_path)
+        raise
+
     except Exception as e:
         # Cleanup on error
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        _remove_files(file_path, parquet_path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Upload failed: {str(e)}"
@@ -111,7 +227,7 @@ async def validate_plan(
     """
     Validate execution plan without executing
     """
-    validation = PlanValidator.validate_plan(plan.dict())
+    validation = PlanValidator.validate_plan(plan)
 
     return {
         'valid': validation['valid'],
@@ -123,6 +239,7 @@ async def validate_plan(
 @router.post("/execute", response_model=ExecutionResult)
 async def execute_plan(
     request: ExecutionRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -131,10 +248,15 @@ async def execute_plan(
     """
     start_time = datetime.utcnow()
 
-    # Verify dataset belongs to user
-    dataset = db.query(Dataset).filter(
-        Dataset.session_id == request.session_id,
-        Dataset.user_id == current_user.id
+    # Verify dataset belongs to user (plain row select, no ORM identity map)
+    dataset = db.execute(
+        select(
+            Dataset.id, Dataset.file_path, Dataset.parquet_path,
+            Dataset.columns, Dataset.column_types, Dataset.expires_at
+        ).where(
+            Dataset.session_id == request.session_id,
+            Dataset.user_id == current_user.id
+        )
     ).first()
 
     if not dataset:
@@ -143,18 +265,9 @@ async def execute_plan(
             detail="Dataset not found"
         )
 
-    # Validate plan
-    plan_dict = request.plan.dict()
-    validation = PlanValidator.validate_plan(plan_dict)
-
-    if not validation['valid']:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                'error': 'Plan validation failed',
-                'validation_errors': validation['errors']
-            }
-        )
+    # Plan structure and cross-field rules were validated by ExecutionPlan.
+    # Dump once in JSON mode; the same dict feeds the engine and the audit row.
+    plan_dict = request.plan.model_dump(mode="json", exclude_none=True)
 
     # Check for clarification requirement
     if request.plan.requires_clarification:
@@ -164,22 +277,47 @@ async def execute_plan(
             'clarification_question': request.plan.clarification_question
         }
 
-    # Execute
-    engine = ExecutionEngine()
-    load_result = engine.load_csv(dataset.file_path)
+    # Only load the columns the plan touches. Unknown names are left out here
+    # so the engine reports them as missing columns.
+    needed = plan_columns(request.plan)
+    if needed is not None:
+        needed &= set(dataset.columns)
+    if not needed:
+        needed = set(dataset.columns)
 
-    if not load_result['success']:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to load CSV: {load_result['error']}"
+    # Execute (reuse the parsed dataset when it is cached)
+    engine = ExecutionEngine()
+    cached_df = _get_cached_dataframe(request.session_id, dataset.file_path)
+
+    if cached_df is not None and needed <= set(cached_df.columns):
+        engine.df = cached_df
+        engine.column_info = dataset.column_types
+    else:
+        if cached_df is not None:
+            needed |= set(cached_df.columns)
+        columns = [col for col in dataset.columns if col in needed]
+
+        load_result = engine.load_csv(
+            dataset.file_path,
+            columns=columns,
+            parquet_path=dataset.parquet_path
         )
 
+        if not load_result['success']:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to load CSV: {load_result['error']}"
+            )
+
+        _cache_dataframe(request.session_id, dataset.file_path, dataset.expires_at, engine.df)
+
     result = engine.execute_plan(plan_dict)
 
     execution_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
-    # Log execution
-    analysis = Analysis(
+    # Log execution once the response has been sent
+    background_tasks.add_task(
+        log_analysis,
         user_id=current_user.id,
         dataset_id=dataset.id,
         session_id=request.session_id,
@@ -192,9 +330,6 @@ async def execute_plan(
         error_message=result.get('error')
     )
 
-    db.add(analysis)
-    db.commit()
-
     return result
 
 
@@ -266,6 +401,7 @@ async def get_analysis_history(
 @router.delete("/datasets/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_dataset(
     session_id: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -283,12 +419,14 @@ async def delete_dataset(
             detail="Dataset not found"
         )
 
-    # Delete file
-    if os.path.exists(dataset.file_path):
-        os.remove(dataset.file_path)
+    _df_cache.pop(session_id, None)
+    file_paths = (dataset.file_path, dataset.parquet_path)
 
     # Database cascade will handle analyses
     db.delete(dataset)
     db.commit()
 
+    # Delete files after the response is sent
+    background_tasks.add_task(_remove_files, *file_paths)
+
     return None
@@ -1,17 +1,54 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
 
-# Create SQLAlchemy engine
+IS_SQLITE = "sqlite" in settings.DATABASE_URL
+
+
+def _json_serializer(value) -> str:
+    """Encode JSON columns with orjson (handles NumPy values and non-str keys)"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _json_deserializer(value):
+    """Decode JSON columns with orjson"""
+    if isinstance(value, (int, float)):
+        # SQLite hands back scalar JSON numbers already converted
+        return value
+    return orjson.loads(value)
+
+
+# Create SQLAlchemy engine (SQLite has a single writer, so keep the pool small)
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+    **({"pool_size": 1} if IS_SQLITE else {})
 )
 
+
+if IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        WAL lets readers proceed while background tasks commit, NORMAL sync
+        only fsyncs at checkpoints, and reads go through a 512MB mmap with a
+        64MB page cache.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA mmap_size=536870912")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -28,7 +65,39 @@ def get_db():
         db.close()
 
 
+# Nullable columns added to existing tables after their first release, as
+# {table: [column]}. create_all never alters a table that already exists.
+ADDED_COLUMNS = {
+    "datasets": ["parquet_path"],
+}
+
+
+def _add_missing_columns():
+    """ALTER TABLE ... ADD COLUMN for each ADDED_COLUMNS entry an existing database lacks"""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table_name, column_names in ADDED_COLUMNS.items():
+            existing = {column["name"] for column in inspector.get_columns(table_name)}
+            for column_name in column_names:
+                if column_name in existing:
+                    continue
+                column = Base.metadata.tables[table_name].c[column_name]
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(
+                    text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
+                )
+
+
+def _create_missing_indexes():
+    """CREATE INDEX for every model index an existing database lacks"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
 def init_db():
-    """Initialize database tables"""
+    """Initialize database tables and add columns and indexes missing from older databases"""
     from app.models import user, dataset, analysis
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+    _create_missing_indexes()
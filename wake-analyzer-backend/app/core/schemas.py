@@ -1,8 +1,8 @@
 """
 Pydantic schemas for API request/response validation
 """
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, EmailStr, Field, model_validator
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 
 
@@ -69,24 +69,62 @@ class DatasetResponse(BaseModel):
 
 # ============ EXECUTION PLAN SCHEMAS ============
 
+FilterOperator = Literal["==", "!=", ">", "<", ">=", "<="]
+
+Operation = Literal[
+    "mean", "sum", "count", "min", "max", "std",
+    "correlation", "regression", "forecast"
+]
+
+ChartType = Literal["line", "bar", "scatter", "heatmap", "box", "histogram"]
+
+
 class FilterSchema(BaseModel):
     column: str
-    operator: str = Field(..., pattern="^(==|!=|>|<|>=|<=)$")
+    operator: FilterOperator
     value: Any
 
 
 class ExecutionPlan(BaseModel):
-    operation: str = Field(..., pattern="^(mean|sum|count|min|max|std|correlation|regression|forecast)$")
+    operation: Operation
     target_column: Optional[str] = None
     filters: List[FilterSchema] = []
     group_by: List[str] = []
     time_column: Optional[str] = None
     x_axis: Optional[str] = None
     y_axis: Optional[str] = None
-    chart_type: Optional[str] = Field(None, pattern="^(line|bar|scatter|heatmap|box|histogram)$")
+    chart_type: Optional[ChartType] = None
     requires_clarification: bool = False
     clarification_question: Optional[str] = None
 
+    @model_validator(mode="after")
+    def check_operation_requirements(self) -> "ExecutionPlan":
+        """Cross-field rules that per-field validation cannot express"""
+        errors = []
+
+        if self.requires_clarification and not self.clarification_question:
+            errors.append(
+                "When requires_clarification is true, "
+                "clarification_question must be provided"
+            )
+
+        if self.operation in ('correlation', 'regression'):
+            if not (self.x_axis and self.y_axis):
+                errors.append(
+                    f"Operation '{self.operation}' requires both x_axis and y_axis"
+                )
+
+        if self.operation == 'forecast':
+            if not self.time_column:
+                errors.append("Operation 'forecast' requires time_column")
+            if not self.target_column:
+                errors.append("Operation 'forecast' requires target_column")
+
+        if errors:
+            raise ValueError("; ".join(errors))
+
+        return self
+
 
 class ValidationResult(BaseModel):
     valid: bool
@@ -4,6 +4,7 @@ Main entry point for the backend API
 """
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from app.core.config import settings
@@ -31,6 +32,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (results, base64 charts)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # Health check endpoint
 @app.get("/health", tags=["Health"])
@@ -43,17 +47,26 @@ async def health_check():
     }
 
 
-# Exception handlers
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc):
-    """Global exception handler"""
-    return JSONResponse(
+# Exception handlers (the DEBUG branch is chosen once, at startup)
+if settings.DEBUG:
+    async def global_exception_handler(request, exc):
+        """Global exception handler exposing the error message"""
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"detail": str(exc)}
+        )
+else:
+    INTERNAL_ERROR_RESPONSE = JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "detail": "Internal server error" if not settings.DEBUG else str(exc)
-        }
+        content={"detail": "Internal server error"}
     )
 
+    async def global_exception_handler(request, exc):
+        """Global exception handler returning a pre-serialized response"""
+        return INTERNAL_ERROR_RESPONSE
+
+app.add_exception_handler(Exception, global_exception_handler)
+
 
 # Include routers
 app.include_router(auth.router, prefix="/api")
@@ -61,11 +74,15 @@ app.include_router(analytics.router, prefix="/api")
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
 
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.DEBUG else os.cpu_count(),
         reload=settings.DEBUG
     )
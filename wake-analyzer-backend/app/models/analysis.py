@@ -1,18 +1,22 @@
 """
 Analysis model for execution history and audit trail
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Boolean, Text
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-import uuid
+from ulid import ULID
 
 from app.core.database import Base
 
 
 class Analysis(Base):
     __tablename__ = "analyses"
+    __table_args__ = (
+        Index("ix_analyses_dataset_executed", "dataset_id", "executed_at"),
+    )
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    # ULIDs are time-ordered, so inserts append to the primary key index
+    id = Column(String, primary_key=True, default=lambda: str(ULID()))
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     dataset_id = Column(String, ForeignKey("datasets.id", ondelete="CASCADE"), nullable=False)
     session_id = Column(String, nullable=False)
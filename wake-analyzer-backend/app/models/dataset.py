@@ -1,22 +1,27 @@
 """
 Dataset model for uploaded CSV files
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
-import uuid
+from ulid import ULID
 
 from app.core.database import Base
 
 
 class Dataset(Base):
     __tablename__ = "datasets"
+    __table_args__ = (
+        Index("ix_datasets_user_uploaded", "user_id", "uploaded_at"),
+    )
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    # ULIDs are time-ordered, so inserts append to the primary key index
+    id = Column(String, primary_key=True, default=lambda: str(ULID()))
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     session_id = Column(String, unique=True, index=True, nullable=False)
     filename = Column(String, nullable=False)
     file_path = Column(String, nullable=False)
+    parquet_path = Column(String, nullable=True)  # Typed columnar copy of the CSV
     row_count = Column(Integer, nullable=False)
     column_count = Column(Integer, nullable=False)
     columns = Column(JSON, nullable=False)  # List of column names
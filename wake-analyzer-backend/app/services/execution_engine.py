@@ -4,9 +4,13 @@ All analytics MUST come from this module. No fabrication allowed.
 """
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from typing import Dict, Any, List, Optional
 from sklearn.linear_model import LinearRegression
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
+import os
 import io
 import base64
 import matplotlib
@@ -14,6 +18,27 @@ matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from app.services.kernels import group_statistic
+
+# CSV files are split into 1MB blocks parsed in parallel. Quoted values may
+# not contain newlines, which keeps block splitting on the fast path.
+CSV_READ_OPTIONS = pacsv.ReadOptions(block_size=1 << 20, use_threads=True)
+CSV_PARSE_OPTIONS = pacsv.ParseOptions(newlines_in_values=False)
+
+# Grouped aggregations computed by the group_reduce kernel
+GROUPED_KERNEL_OPERATIONS = {'mean', 'sum', 'min', 'max', 'std'}
+
+
+def _plot_values(series: pd.Series) -> np.ndarray:
+    """
+    NumPy values of a column for matplotlib, which cannot handle the
+    pd.NA of Arrow-backed columns; callers drop missing rows first.
+    """
+    if isinstance(series.dtype, pd.ArrowDtype):
+        numpy_dtype = series.dtype.numpy_dtype
+        return series.to_numpy(dtype=object if numpy_dtype.kind in 'OUS' else numpy_dtype)
+    return series.to_numpy()
+
 
 class ExecutionEngine:
     """
@@ -25,27 +50,66 @@ class ExecutionEngine:
         self.df: Optional[pd.DataFrame] = None
         self.column_info: Dict[str, str] = {}
 
-    def load_csv(self, file_path: str) -> Dict[str, Any]:
+    def load_csv(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        parquet_path: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Load CSV file and return metadata.
 
+        Args:
+            file_path: Path to the uploaded CSV
+            columns: Only load these columns (None loads all of them)
+            parquet_path: Typed Parquet copy of the CSV. Read instead of the
+                CSV when it exists, otherwise written after parsing.
+
         Returns:
             Dict with columns, types, row count, and preview
         """
         try:
-            self.df = pd.read_csv(file_path)
+            if parquet_path and os.path.exists(parquet_path):
+                table = pq.read_table(parquet_path, columns=columns, memory_map=True)
+            else:
+                # The Parquet copy must hold every column, so only project
+                # at parse time when no copy is being written.
+                # Empty fields in string columns are missing, as in pd.read_csv.
+                convert_options = pacsv.ConvertOptions(
+                    include_columns=columns if columns and not parquet_path else None,
+                    strings_can_be_null=True
+                )
+
+                # Arrow's multi-threaded reader does tokenization and type
+                # inference once; pandas columns are then backed by Arrow memory.
+                # The file is memory-mapped rather than read into the heap.
+                with pa.memory_map(file_path, 'r') as source:
+                    table = pacsv.read_csv(
+                        source,
+                        read_options=CSV_READ_OPTIONS,
+                        parse_options=CSV_PARSE_OPTIONS,
+                        convert_options=convert_options
+                    )
+                if parquet_path:
+                    pq.write_table(table, parquet_path, compression='zstd', use_dictionary=True)
+                    if columns:
+                        table = table.select(columns)
 
             # Store column types
             self.column_info = {
-                col: str(dtype) for col, dtype in self.df.dtypes.items()
+                field.name: str(field.type) for field in table.schema
             }
+            columns = table.column_names
+            preview = table.slice(0, 5).to_pylist()
+
+            self.df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
 
             return {
                 'success': True,
-                'columns': list(self.df.columns),
+                'columns': columns,
                 'column_types': self.column_info,
                 'row_count': len(self.df),
-                'preview': self.df.head(5).to_dict(orient='records')
+                'preview': preview
             }
         except Exception as e:
             return {
@@ -109,7 +173,7 @@ class ExecutionEngine:
         for f in filters:
             column = f['column']
             operator = f['operator']
-            value = f['value']
+            value = f.get('value')
 
             if column not in filtered.columns:
                 raise ValueError(f"Column '{column}' not found in dataset")
@@ -123,6 +187,14 @@ class ExecutionEngine:
                     raise ValueError(
                         f"Cannot compare numeric column '{column}' with non-numeric value '{value}'"
                     )
+            elif isinstance(col_dtype, pd.ArrowDtype) and pa.types.is_temporal(col_dtype.pyarrow_dtype):
+                # Arrow parses ISO dates, so compare against a date, not its string
+                try:
+                    value = pa.scalar(value).cast(col_dtype.pyarrow_dtype).as_py()
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError, TypeError):
+                    raise ValueError(
+                        f"Cannot compare date column '{column}' with value '{value}'"
+                    )
 
             # Apply operator
             if operator == '==':
@@ -146,6 +218,14 @@ class ExecutionEngine:
         target_col = plan.get('target_column')
         group_by = plan.get('group_by', [])
 
+        # Numeric grouped aggregations go through the single-pass kernel
+        if (
+            group_by
+            and operation in GROUPED_KERNEL_OPERATIONS
+            and pd.api.types.is_numeric_dtype(df[target_col].dtype)
+        ):
+            return self._grouped_statistic(df, group_by, target_col, operation)
+
         # Aggregation operations
         if operation == 'mean':
             if group_by:
@@ -216,7 +296,7 @@ class ExecutionEngine:
 
             # Sort by time
             df_sorted = df.sort_values(time_col)
-            values = df_sorted[target_col].values
+            values = df_sorted[target_col].to_numpy(dtype=np.float64)
 
             # Use last 12 points or all if less
             train_size = min(len(values), 12)
@@ -250,6 +330,32 @@ class ExecutionEngine:
         else:
             raise ValueError(f"Unknown operation: {operation}")
 
+    def _grouped_statistic(
+        self,
+        df: pd.DataFrame,
+        group_by: List[str],
+        target_col: str,
+        operation: str
+    ) -> Dict[Any, Any]:
+        """Grouped mean/sum/min/max/std computed in one pass over the data"""
+        grouped = df.groupby(group_by, sort=True, observed=True)
+
+        # Rows with a missing group key are numbered NaN; the kernel skips -1
+        codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+        values = df[target_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        result = group_statistic(operation, codes, values, grouped.ngroups)
+
+        # Keep integer results for integer columns, as pandas does
+        if (
+            operation in ('sum', 'min', 'max')
+            and pd.api.types.is_integer_dtype(df[target_col].dtype)
+            and not np.isnan(result).any()
+        ):
+            result = result.astype(np.int64)
+
+        keys = grouped.size().index
+        return dict(zip(keys.tolist(), result.tolist()))
+
     def _generate_chart(self, df: pd.DataFrame, plan: Dict[str, Any]) -> Optional[str]:
         """Generate chart and return as base64 encoded image"""
         chart_type = plan.get('chart_type')
@@ -264,7 +370,8 @@ class ExecutionEngine:
                 x_col = plan.get('x_axis')
                 y_col = plan.get('y_axis') or plan.get('target_column')
                 if x_col and y_col:
-                    plt.plot(df[x_col], df[y_col], linewidth=2)
+                    points = df[[x_col, y_col]].dropna()
+                    plt.plot(_plot_values(points[x_col]), _plot_values(points[y_col]), linewidth=2)
                     plt.xlabel(x_col, fontsize=12)
                     plt.ylabel(y_col, fontsize=12)
 
@@ -276,7 +383,11 @@ class ExecutionEngine:
                         grouped = df.groupby(x_col)[y_col].mean()
                         grouped.plot(kind='bar', color='steelblue')
                     else:
-                        plt.bar(df[x_col], df[y_col], color='steelblue')
+                        points = df[[x_col, y_col]].dropna()
+                        plt.bar(
+                            _plot_values(points[x_col]), _plot_values(points[y_col]),
+                            color='steelblue'
+                        )
                     plt.xlabel(x_col, fontsize=12)
                     plt.ylabel(y_col, fontsize=12)
                     plt.xticks(rotation=45)
@@ -285,21 +396,28 @@ class ExecutionEngine:
                 x_col = plan.get('x_axis')
                 y_col = plan.get('y_axis')
                 if x_col and y_col:
-                    plt.scatter(df[x_col], df[y_col], alpha=0.6, s=50, color='steelblue')
+                    points = df[[x_col, y_col]].dropna()
+                    plt.scatter(
+                        _plot_values(points[x_col]), _plot_values(points[y_col]),
+                        alpha=0.6, s=50, color='steelblue'
+                    )
                     plt.xlabel(x_col, fontsize=12)
                     plt.ylabel(y_col, fontsize=12)
 
             elif chart_type == 'histogram':
                 target_col = plan.get('target_column')
                 if target_col:
-                    plt.hist(df[target_col], bins=30, edgecolor='black', color='steelblue')
+                    plt.hist(
+                        _plot_values(df[target_col].dropna()),
+                        bins=30, edgecolor='black', color='steelblue'
+                    )
                     plt.xlabel(target_col, fontsize=12)
                     plt.ylabel('Frequency', fontsize=12)
 
             elif chart_type == 'box':
                 target_col = plan.get('target_column')
                 if target_col:
-                    plt.boxplot(df[target_col])
+                    plt.boxplot(_plot_values(df[target_col].dropna()))
                     plt.ylabel(target_col, fontsize=12)
 
             elif chart_type == 'heatmap':
@@ -0,0 +1,95 @@
+"""
+Numerical kernels used by the Execution Engine.
+Compiled with numba when it is installed, plain NumPy otherwise.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _group_reduce_loop(codes: np.ndarray, values: np.ndarray, n_groups: int):
+    """
+    Single pass over the data computing per-group sum, count, min, max and
+    the sum of squared deviations from the mean (Welford's update).
+    Rows with a negative group code or a NaN value are skipped.
+    """
+    total = np.zeros(n_groups)
+    count = np.zeros(n_groups)
+    minimum = np.full(n_groups, np.inf)
+    maximum = np.full(n_groups, -np.inf)
+    mean = np.zeros(n_groups)
+    m2 = np.zeros(n_groups)
+
+    for i in range(values.shape[0]):
+        g = codes[i]
+        v = values[i]
+        if g < 0 or np.isnan(v):
+            continue
+
+        total[g] += v
+        count[g] += 1
+        if v < minimum[g]:
+            minimum[g] = v
+        if v > maximum[g]:
+            maximum[g] = v
+
+        delta = v - mean[g]
+        mean[g] += delta / count[g]
+        m2[g] += delta * (v - mean[g])
+
+    return total, count, minimum, maximum, m2
+
+
+def _group_reduce_numpy(codes: np.ndarray, values: np.ndarray, n_groups: int):
+    """NumPy equivalent of _group_reduce_loop for environments without numba"""
+    valid = (codes >= 0) & ~np.isnan(values)
+    codes = codes[valid]
+    values = values[valid]
+
+    count = np.bincount(codes, minlength=n_groups).astype(np.float64)
+    total = np.bincount(codes, weights=values, minlength=n_groups)
+
+    minimum = np.full(n_groups, np.inf)
+    maximum = np.full(n_groups, -np.inf)
+    np.minimum.at(minimum, codes, values)
+    np.maximum.at(maximum, codes, values)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+    m2 = np.bincount(codes, weights=(values - mean[codes]) ** 2, minlength=n_groups)
+
+    return total, count, minimum, maximum, m2
+
+
+if NUMBA_AVAILABLE:
+    group_reduce = njit(cache=True, nogil=True)(_group_reduce_loop)
+else:
+    group_reduce = _group_reduce_numpy
+
+
+def group_statistic(operation: str, codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Per-group mean, sum, min, max or std (ddof=1) of float64 values.
+
+    Matches pandas groupby semantics: NaN values are skipped, empty groups
+    give NaN (0 for sum) and std needs at least two values.
+    """
+    total, count, minimum, maximum, m2 = group_reduce(codes, values, n_groups)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if operation == 'sum':
+            return total
+        if operation == 'mean':
+            return np.where(count > 0, total / count, np.nan)
+        if operation == 'min':
+            return np.where(count > 0, minimum, np.nan)
+        if operation == 'max':
+            return np.where(count > 0, maximum, np.nan)
+        if operation == 'std':
+            return np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+
+    raise ValueError(f"Unsupported grouped operation: {operation}")
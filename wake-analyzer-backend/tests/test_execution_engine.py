@@ -0,0 +1,91 @@
+"""
+Regression tests for the Execution Engine
+"""
+
+from pathlib import Path
+
+import pytest
+
+from app.services.execution_engine import ExecutionEngine
+
+TEST_DATA = Path(__file__).resolve().parents[2] / 'test_data'
+
+
+@pytest.fixture
+def sales_engine():
+    engine = ExecutionEngine()
+    loaded = engine.load_csv(str(TEST_DATA / 'test_sales.csv'))
+    assert loaded['success'], loaded
+    return engine
+
+
+@pytest.mark.parametrize('operator, value, expected_rows', [
+    ('==', '2024-01-02', 3),
+    ('>=', '2024-01-02', 6),
+    ('<', '2024-01-02', 3),
+])
+def test_filter_date_column_with_iso_string(sales_engine, operator, value, expected_rows):
+    response = sales_engine.execute_plan({
+        'operation': 'mean',
+        'target_column': 'sales',
+        'filters': [{'column': 'date', 'operator': operator, 'value': value}],
+    })
+
+    assert response['success'], response
+    assert response['filtered_row_count'] == expected_rows
+
+
+def test_filter_date_column_equality_result(sales_engine):
+    response = sales_engine.execute_plan({
+        'operation': 'mean',
+        'target_column': 'sales',
+        'filters': [{'column': 'date', 'operator': '==', 'value': '2024-01-02'}],
+    })
+
+    assert response['result'] == pytest.approx(1166.67, abs=0.01)
+
+
+def test_filter_date_column_with_invalid_value(sales_engine):
+    response = sales_engine.execute_plan({
+        'operation': 'count',
+        'filters': [{'column': 'date', 'operator': '==', 'value': 'yesterday'}],
+    })
+
+    assert not response['success']
+    assert "Cannot compare date column 'date'" in response['error']
+
+
+def test_empty_string_fields_are_missing(tmp_path):
+    csv_path = tmp_path / 'gaps.csv'
+    csv_path.write_text('region,sales\nNorth,1200\n,1100\nSouth,900\n')
+    engine = ExecutionEngine()
+    assert engine.load_csv(str(csv_path))['success']
+
+    response = engine.execute_plan({'operation': 'count', 'group_by': ['region']})
+
+    assert response['result'] == {'North': 1, 'South': 1}
+
+
+@pytest.mark.parametrize('chart_type', ['histogram', 'box', 'line', 'bar', 'scatter'])
+def test_chart_on_column_with_missing_values(tmp_path, chart_type):
+    csv_path = tmp_path / 'gaps.csv'
+    csv_path.write_text(
+        'date,region,sales,units\n'
+        '2024-01-01,North,1200,40\n'
+        '2024-01-02,,,35\n'
+        '2024-01-03,South,1300,\n'
+        ',East,1250,38\n'
+    )
+    engine = ExecutionEngine()
+    assert engine.load_csv(str(csv_path))['success']
+
+    response = engine.execute_plan({
+        'operation': 'mean',
+        'target_column': 'sales',
+        'x_axis': 'units' if chart_type == 'scatter' else 'date',
+        'y_axis': 'sales',
+        'chart_type': chart_type,
+    })
+
+    assert response['success'], response
+    assert response['chart'].startswith('data:image/png;base64,')
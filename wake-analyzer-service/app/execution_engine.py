@@ -6,15 +6,341 @@ NO results may be fabricated or computed outside this module.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
-from sklearn.linear_model import LinearRegression
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
+import pyarrow as pa
+from typing import Dict, Any, List, Optional, Tuple, Union, BinaryIO
+import operator
 import io
+import logging
+import os
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+FILTER_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+
+# Plan operation -> pandas Series/GroupBy reduction method
+AGGREGATIONS = {
+    'mean': 'mean',
+    'sum': 'sum',
+    'min': 'min',
+    'max': 'max',
+    'std': 'std',
+}
+
+# Numeric columns keep full precision unless WAKE_PRECISION=f32, which
+# stores them as 32-bit floats and the smallest fitting integers on load
+PRECISION = os.getenv('WAKE_PRECISION', 'f64')
+
+# Forecast settings: additive Holt-Winters over quarterly seasons, with the
+# smoothing parameters picked from this grid by one-step-ahead squared error
+SEASONAL_PERIODS = 4
+FORECAST_STEPS = 3
+SMOOTHING_GRID = np.linspace(0.1, 0.9, 9)
+
+# Chart resolution and PNG zlib level (1 = fastest, 9 = smallest)
+CHART_DPI = int(os.getenv('WAKE_CHART_DPI', 80))
+PNG_COMPRESS_LEVEL = int(os.getenv('WAKE_PNG_COMPRESS_LEVEL', 1))
+
+# Charts are drawn on one Agg figure created at import and reused for every
+# request; the lock serializes rendering across Flask's worker threads
+_CHART_FIGURE = Figure(figsize=(10, 6), dpi=CHART_DPI)
+FigureCanvasAgg(_CHART_FIGURE)
+_CHART_LOCK = threading.Lock()
+
+# Shared pool for reducing several target columns of one plan concurrently;
+# the NumPy and numba reductions release the GIL. The numba kernels are
+# single-threaded, so this pool is the only level of parallelism and at
+# most one thread per core runs a reduction
+_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# column_info types compared as numbers in filters
+NUMERIC_TYPE_PREFIXES = ('int', 'uint', 'float', 'bool')
+
+
+def _dtype_name(dtype) -> str:
+    """Name Arrow-backed columns the way pd.read_csv would type them"""
+    if isinstance(dtype, pd.ArrowDtype):
+        numpy_dtype = dtype.numpy_dtype
+        return 'object' if numpy_dtype.kind in 'OUS' else str(numpy_dtype)
+    return str(dtype)
+
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store float columns as float32 and integer columns in the smallest
+    integer type holding their values, halving the bytes every operation
+    reads.
+    """
+    for col, dtype in df.dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+        if pd.api.types.is_float_dtype(dtype):
+            df[col] = pd.to_numeric(df[col], downcast='float')
+        elif pd.api.types.is_integer_dtype(dtype):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+def _correlation_matrix(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    Pearson correlation matrix of the given numeric columns, computed by
+    np.corrcoef on one contiguous float32 block. Columns with missing
+    values need pairwise-complete rows, which pandas' corr() handles.
+    """
+    values = np.ascontiguousarray(df[columns].to_numpy(dtype=np.float32, na_value=np.nan))
+    if np.isnan(values).any():
+        return df[columns].corr().to_numpy()
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.corrcoef(values, rowvar=False)
+
+
+def _plot_values(series: pd.Series) -> np.ndarray:
+    """
+    NumPy values of a column for matplotlib, which cannot handle the
+    pd.NA of Arrow-backed columns; callers drop missing rows first.
+    """
+    if isinstance(series.dtype, pd.ArrowDtype):
+        numpy_dtype = series.dtype.numpy_dtype
+        return series.to_numpy(dtype=object if numpy_dtype.kind in 'OUS' else numpy_dtype)
+    return series.to_numpy()
+
+
+def _series_to_dict(series: pd.Series) -> Dict[Any, Any]:
+    """
+    Convert a grouped result to a dict with two bulk tolist() calls instead
+    of to_dict(), which boxes every key and value through pandas.
+    """
+    return dict(zip(series.index.tolist(), series.tolist()))
+
+
+def _map_targets(target_col: Union[str, List[str]], reduce) -> Any:
+    """
+    Apply reduce to a single target column, or to each column of a list
+    concurrently on _POOL, returning {column: result}. reduce must not
+    start parallel work of its own.
+    """
+    if isinstance(target_col, list):
+        return dict(zip(target_col, _POOL.map(reduce, target_col)))
+    return reduce(target_col)
+
+
+def _jit(func):
+    """
+    Compile with numba when it is installed, run as plain Python otherwise.
+    Kernels are single-threaded: they are called concurrently from the
+    gunicorn threads and _POOL, which numba's parallel threading layers
+    (workqueue in particular) do not allow.
+    """
+    if NUMBA_AVAILABLE:
+        return njit(cache=True, nogil=True)(func)
+    return func
+
+
+@_jit
+def masked_reduce(values, mask):
+    """
+    Sum, count, min and max of the non-NaN values where mask is set,
+    in one pass with no filtered copy.
+    """
+    total = 0.0
+    count = 0
+    minimum = np.inf
+    maximum = -np.inf
+    for i in range(values.shape[0]):
+        if mask[i] and values[i] == values[i]:
+            v = values[i]
+            total += v
+            count += 1
+            minimum = min(minimum, v)
+            maximum = max(maximum, v)
+    return total, count, minimum, maximum
+
+
+@_jit
+def masked_squared_deviation(values, mask, mean):
+    """Sum of squared deviations from mean of the non-NaN values where mask is set"""
+    total = 0.0
+    for i in range(values.shape[0]):
+        if mask[i] and values[i] == values[i]:
+            d = values[i] - mean
+            total += d * d
+    return total
+
+
+@_jit
+def group_reduce(codes, values, n_groups):
+    """
+    Per-group sum, count, min, max and sum of squared deviations from the
+    mean (Welford's update) in one pass. Rows with a negative group code
+    or a NaN value are skipped, so all-NaN groups come back with count 0.
+    """
+    total = np.zeros(n_groups)
+    count = np.zeros(n_groups)
+    minimum = np.full(n_groups, np.inf)
+    maximum = np.full(n_groups, -np.inf)
+    mean = np.zeros(n_groups)
+    m2 = np.zeros(n_groups)
+
+    for i in range(values.shape[0]):
+        g = codes[i]
+        v = values[i]
+        if g < 0 or np.isnan(v):
+            continue
+
+        total[g] += v
+        count[g] += 1
+        if v < minimum[g]:
+            minimum[g] = v
+        if v > maximum[g]:
+            maximum[g] = v
+
+        delta = v - mean[g]
+        mean[g] += delta / count[g]
+        m2[g] += delta * (v - mean[g])
+
+    return total, count, minimum, maximum, m2
+
+
+def _group_statistic(method: str, codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Per-group mean, sum, min, max or std (ddof=1) of float64 values with
+    pandas' semantics: NaN is skipped, a group with no values gives NaN
+    (0 for sum) and std needs at least two values.
+    """
+    total, count, minimum, maximum, m2 = group_reduce(codes, values, n_groups)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if method == 'sum':
+            return total
+        if method == 'mean':
+            return np.where(count > 0, total / count, np.nan)
+        if method == 'min':
+            return np.where(count > 0, minimum, np.nan)
+        if method == 'max':
+            return np.where(count > 0, maximum, np.nan)
+        if method == 'std':
+            return np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+
+    raise ValueError(f"Unsupported grouped operation: {method}")
+
+
+@_jit
+def _holt_winters_fit(y, m, alpha, beta, gamma):
+    """
+    Run additive level/trend/seasonal smoothing over y.
+
+    Returns the sum of squared one-step-ahead errors and the final level,
+    trend and seasonal components.
+    """
+    level = y[:m].mean()
+    trend = (y[m:2 * m].mean() - level) / m
+    season = y[:m] - level
+
+    sse = 0.0
+    for t in range(y.shape[0]):
+        s = season[t % m]
+        error = y[t] - (level + trend + s)
+        sse += error * error
+
+        previous_level = level
+        level = alpha * (y[t] - s) + (1.0 - alpha) * (level + trend)
+        trend = beta * (level - previous_level) + (1.0 - beta) * trend
+        season[t % m] = gamma * (y[t] - level) + (1.0 - gamma) * s
+
+    return sse, level, trend, season
+
+
+@_jit
+def holt_winters_additive(y, m, steps, grid):
+    """
+    Forecast `steps` values after y with additive Holt-Winters.
+    y needs at least two full seasons of m values.
+    """
+    best_sse = np.inf
+    best_alpha = best_beta = best_gamma = grid[0]
+    for alpha in grid:
+        for beta in grid:
+            for gamma in grid:
+                sse = _holt_winters_fit(y, m, alpha, beta, gamma)[0]
+                if sse < best_sse:
+                    best_sse = sse
+                    best_alpha, best_beta, best_gamma = alpha, beta, gamma
+
+    _, level, trend, season = _holt_winters_fit(y, m, best_alpha, best_beta, best_gamma)
+
+    n = y.shape[0]
+    forecast = np.empty(steps)
+    for h in range(1, steps + 1):
+        forecast[h - 1] = level + h * trend + season[(n + h - 1) % m]
+    return forecast
+
+
+class NumpyTable:
+    """
+    A DataFrame plus cached NumPy arrays of its numeric columns.
+
+    Arrays are converted on first use and kept for the life of the
+    session, so filters and reductions compare plain ndarrays instead of
+    going through pandas/Arrow wrappers on every request. Missing values
+    become NaN.
+
+    Groupings are cached the same way: the group code of every row for a
+    group_by column list is hashed out once, and repeated aggregations over
+    the same columns reuse it.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._groupings: Dict[Tuple[str, ...], Tuple[np.ndarray, pd.Index]] = {}
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        values = self._arrays.get(column)
+        if values is None:
+            series = self.df[column]
+            if isinstance(series.dtype, pd.ArrowDtype):
+                dtype = np.float64 if series.hasnans else series.dtype.numpy_dtype
+                values = series.to_numpy(dtype=dtype, na_value=np.nan)
+            else:
+                values = series.to_numpy()
+            self._arrays[column] = values
+        return values
+
+    def grouping(self, group_by: List[str]) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Group code of every row (-1 where a key is missing) and the sorted
+        group keys the codes index into.
+        """
+        key = tuple(group_by)
+        grouping = self._groupings.get(key)
+        if grouping is None:
+            groupby = self.df.groupby(group_by)
+            codes = groupby.ngroup().to_numpy(dtype=np.float64, na_value=-1).astype(np.int64)
+            grouping = (codes, groupby.size().index)
+            self._groupings[key] = grouping
+        return grouping
 
 
 class ExecutionEngine:
@@ -23,31 +349,49 @@ class ExecutionEngine:
     This is the ONLY authority for numerical results.
     """
 
-    def __init__(self):
-        self.df: Optional[pd.DataFrame] = None
-        self.column_info: Dict[str, str] = {}
-
-    def load_csv(self, file_path: str) -> Dict[str, Any]:
+    def __init__(
+        self,
+        df: Optional[pd.DataFrame] = None,
+        column_info: Optional[Dict[str, str]] = None,
+        table: Optional[NumpyTable] = None
+    ):
+        self.df: Optional[pd.DataFrame] = df
+        if column_info is None and df is not None:
+            column_info = {col: _dtype_name(dtype) for col, dtype in df.dtypes.items()}
+        self.column_info: Dict[str, str] = column_info or {}
+        if table is None and df is not None:
+            table = NumpyTable(df)
+        self.table: Optional[NumpyTable] = table
+
+    def load_csv(self, source: Union[str, BinaryIO]) -> Dict[str, Any]:
         """
-        Load CSV file and return metadata.
+        Load CSV data from a path or an in-memory file object and return metadata.
 
         Returns:
             Dictionary with column names, types, and row count
         """
         try:
-            self.df = pd.read_csv(file_path)
+            # Multithreaded Arrow parse into Arrow-backed columns
+            self.df = pd.read_csv(source, engine='pyarrow', dtype_backend='pyarrow')
+
+            # Preview the values as parsed, before any downcasting
+            preview = self.df.head(5).to_dict(orient='records')
+
+            if PRECISION == 'f32':
+                self.df = _downcast_numeric(self.df)
 
             # Infer and store column types
             self.column_info = {
-                col: str(dtype) for col, dtype in self.df.dtypes.items()
+                col: _dtype_name(dtype) for col, dtype in self.df.dtypes.items()
             }
+            self.table = NumpyTable(self.df)
 
             return {
                 'success': True,
                 'columns': list(self.df.columns),
                 'column_types': self.column_info,
                 'row_count': len(self.df),
-                'preview': self.df.head(5).to_dict(orient='records')
+                'preview': preview
             }
         except Exception as e:
             return {
@@ -72,8 +416,30 @@ class ExecutionEngine:
             }
 
         try:
+            # Filtered single-column reductions run on the mask directly
+            if self._can_reduce_masked(plan):
+                operation = plan['operation']
+                mask = self._filter_mask(self.table, plan['filters'])
+                row_count = np.count_nonzero(mask)
+                if row_count == 0:
+                    return {
+                        'success': False,
+                        'error': 'Filters resulted in empty dataset'
+                    }
+
+                return {
+                    'success': True,
+                    'operation': operation,
+                    'result': _map_targets(
+                        plan['target_column'],
+                        lambda col: self._masked_aggregate(col, mask, operation)
+                    ),
+                    'chart': None,
+                    'filtered_row_count': row_count
+                }
+
             # Apply filters first
-            filtered_df = self._apply_filters(self.df, plan.get('filters', []))
+            filtered_df = self._apply_filters(self.table, plan.get('filters', []))
 
             if filtered_df.empty:
                 return {
@@ -104,43 +470,117 @@ class ExecutionEngine:
                 'error': f'Execution failed: {str(e)}'
             }
 
-    def _apply_filters(self, df: pd.DataFrame, filters: List[Dict]) -> pd.DataFrame:
-        """Apply filters to dataframe"""
-        filtered = df.copy()
-
+    def _can_reduce_masked(self, plan: Dict[str, Any]) -> bool:
+        """Whether the plan is a filtered, ungrouped, chart-less numeric reduction"""
+        target_col = plan.get('target_column')
+        target_cols = target_col if isinstance(target_col, list) else [target_col]
+        return (
+            NUMBA_AVAILABLE
+            and bool(plan.get('filters'))
+            and plan['operation'] in AGGREGATIONS
+            and not plan.get('group_by')
+            and not plan.get('chart_type')
+            and all(
+                self.column_info.get(col, '').startswith(('int', 'uint', 'float'))
+                for col in target_cols
+            )
+        )
+
+    def _masked_aggregate(self, column: str, mask: np.ndarray, operation: str) -> Union[int, float]:
+        """mean/sum/min/max/std of column over the rows selected by mask, via the fused kernels"""
+        values = self.table[column]
+        total, count, minimum, maximum = masked_reduce(values, mask)
+
+        # Integer columns keep integer sums/minimums/maximums, as pandas does
+        as_result = int if self.column_info.get(column, '').startswith(('int', 'uint')) else float
+
+        if operation == 'sum':
+            return as_result(total)
+        if count == 0:
+            return float('nan')
+        if operation == 'mean':
+            return total / count
+        if operation == 'min':
+            return as_result(minimum)
+        if operation == 'max':
+            return as_result(maximum)
+        # std, sample (ddof=1) like pandas
+        if count < 2:
+            return float('nan')
+        return np.sqrt(masked_squared_deviation(values, mask, total / count) / (count - 1))
+
+    def _apply_filters(self, table: NumpyTable, filters: List[Dict]) -> pd.DataFrame:
+        """Apply filters to dataframe (combined into one mask, indexed once)"""
+        if not filters:
+            return table.df
+
+        # Gather the selected rows with a single take() over their positions
+        mask = self._filter_mask(table, filters)
+        if mask.all():
+            return table.df
+        return table.df.take(np.flatnonzero(mask))
+
+    def _filter_mask(self, table: NumpyTable, filters: List[Dict]) -> np.ndarray:
+        """Boolean row mask matching every filter"""
+        df = table.df
+        numeric_cols = {
+            col for col, col_type in self.column_info.items()
+            if col_type.startswith(NUMERIC_TYPE_PREFIXES)
+        }
+
+        # Group filters by column so each column is fetched and typed once
+        filters_by_column: Dict[str, List[Dict]] = {}
         for f in filters:
-            column = f['column']
-            operator = f['operator']
-            value = f['value']
+            filters_by_column.setdefault(f['column'], []).append(f)
 
-            if column not in filtered.columns:
+        mask = np.ones(len(df), dtype=bool)
+
+        for column, column_filters in filters_by_column.items():
+            if column not in df.columns:
                 raise ValueError(f"Column '{column}' not found in dataset")
 
-            # Convert value to appropriate type
-            col_dtype = filtered[column].dtype
-            if pd.api.types.is_numeric_dtype(col_dtype):
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    raise ValueError(
-                        f"Cannot compare numeric column '{column}' with non-numeric value '{value}'"
-                    )
-
-            # Apply operator
-            if operator == '==':
-                filtered = filtered[filtered[column] == value]
-            elif operator == '!=':
-                filtered = filtered[filtered[column] != value]
-            elif operator == '>':
-                filtered = filtered[filtered[column] > value]
-            elif operator == '<':
-                filtered = filtered[filtered[column] < value]
-            elif operator == '>=':
-                filtered = filtered[filtered[column] >= value]
-            elif operator == '<=':
-                filtered = filtered[filtered[column] <= value]
-
-        return filtered
+            # Numeric columns are compared as cached ndarrays, the rest as Series
+            is_numeric = column in numeric_cols
+            series = None if is_numeric else df[column]
+            temporal_type = None
+            if (
+                not is_numeric
+                and isinstance(series.dtype, pd.ArrowDtype)
+                and pa.types.is_temporal(series.dtype.pyarrow_dtype)
+            ):
+                temporal_type = series.dtype.pyarrow_dtype
+
+            for f in column_filters:
+                value = f['value']
+
+                # Convert value to appropriate type
+                if is_numeric:
+                    try:
+                        value = float(value)
+                    except (ValueError, TypeError):
+                        raise ValueError(
+                            f"Cannot compare numeric column '{column}' with non-numeric value '{value}'"
+                        )
+                elif temporal_type is not None:
+                    try:
+                        value = pa.scalar(value).cast(temporal_type).as_py()
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, TypeError):
+                        raise ValueError(
+                            f"Cannot compare date column '{column}' with value '{value}'"
+                        )
+
+                # Apply operator (missing values never match)
+                compare = FILTER_OPERATORS[f['operator']]
+                if is_numeric:
+                    values = table[column]
+                    matches = compare(values, value)
+                    if f['operator'] == '!=' and values.dtype.kind == 'f':
+                        matches &= ~np.isnan(values)
+                    mask &= matches
+                else:
+                    mask &= compare(series, value).to_numpy(dtype=bool, na_value=False)
+
+        return mask
 
     def _execute_operation(self, df: pd.DataFrame, plan: Dict[str, Any]) -> Any:
         """Execute the specified operation"""
@@ -149,43 +589,36 @@ class ExecutionEngine:
         group_by = plan.get('group_by', [])
 
         # Aggregation operations
-        if operation == 'mean':
-            if group_by:
-                return df.groupby(group_by)[target_col].mean().to_dict()
-            return float(df[target_col].mean())
-
-        elif operation == 'sum':
-            if group_by:
-                return df.groupby(group_by)[target_col].sum().to_dict()
-            return float(df[target_col].sum())
-
-        elif operation == 'count':
-            if group_by:
-                return df.groupby(group_by).size().to_dict()
-            return int(len(df))
-
-        elif operation == 'min':
+        if operation == 'count':
             if group_by:
-                return df.groupby(group_by)[target_col].min().to_dict()
-            return float(df[target_col].min())
-
-        elif operation == 'max':
-            if group_by:
-                return df.groupby(group_by)[target_col].max().to_dict()
-            return float(df[target_col].max())
-
-        elif operation == 'std':
+                codes, keys = self._group_codes(df, group_by)
+                counts = np.bincount(codes[codes >= 0], minlength=len(keys))
+                present = np.flatnonzero(counts)
+                return dict(zip(keys.take(present).tolist(), counts[present].tolist()))
+            return len(df)
+
+        if operation in AGGREGATIONS:
+            method = AGGREGATIONS[operation]
             if group_by:
-                return df.groupby(group_by)[target_col].std().to_dict()
-            return float(df[target_col].std())
+                return _map_targets(
+                    target_col,
+                    lambda col: _series_to_dict(self._grouped_aggregate(df, group_by, col, method))
+                )
+            return _map_targets(target_col, lambda col: getattr(df[col], method)())
 
         # Correlation
-        elif operation == 'correlation':
+        if operation == 'correlation':
             x_col = plan['x_axis']
             y_col = plan['y_axis']
-            correlation = df[[x_col, y_col]].corr().iloc[0, 1]
+            x = df[x_col].to_numpy(dtype=np.float32, na_value=np.nan)
+            y = df[y_col].to_numpy(dtype=np.float32, na_value=np.nan)
+
+            # Pearson correlation over rows where both values are present
+            complete = ~(np.isnan(x) | np.isnan(y))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                correlation = np.corrcoef(x[complete], y[complete])[0, 1]
             return {
-                'correlation_coefficient': float(correlation),
+                'correlation_coefficient': correlation,
                 'x_column': x_col,
                 'y_column': y_col
             }
@@ -195,18 +628,34 @@ class ExecutionEngine:
             x_col = plan['x_axis']
             y_col = plan['y_axis']
 
-            X = df[[x_col]].values
-            y = df[y_col].values
-
-            model = LinearRegression()
-            model.fit(X, y)
-
-            r_squared = model.score(X, y)
+            x = df[x_col].to_numpy(dtype=np.float64, na_value=np.nan)
+            y = df[y_col].to_numpy(dtype=np.float64, na_value=np.nan)
+
+            # Fit on rows where both values are present
+            complete = ~(np.isnan(x) | np.isnan(y))
+            if not complete.any():
+                raise ValueError(f"No rows with both '{x_col}' and '{y_col}' present")
+            x = x[complete]
+            y = y[complete]
+
+            # Ordinary least squares for a single feature, in closed form
+            x_mean = x.mean()
+            y_mean = y.mean()
+            dx = x - x_mean
+            dy = y - y_mean
+            sxx = dx @ dx
+            ss_tot = dy @ dy
+
+            slope = (dx @ dy) / sxx if sxx else 0.0
+            intercept = y_mean - slope * x_mean
+            residuals = y - (slope * x + intercept)
+            ss_res = residuals @ residuals
+            r_squared = 1.0 - ss_res / ss_tot if ss_tot else 1.0
 
             return {
-                'slope': float(model.coef_[0]),
-                'intercept': float(model.intercept_),
-                'r_squared': float(r_squared),
+                'slope': slope,
+                'intercept': intercept,
+                'r_squared': r_squared,
                 'x_column': x_col,
                 'y_column': y_col
             }
@@ -219,41 +668,88 @@ class ExecutionEngine:
             # Sort by time
             df_sorted = df.sort_values(time_col)
 
-            # Simple exponential smoothing forecast
-            values = df_sorted[target_col].values
+            values = df_sorted[target_col].to_numpy(dtype=np.float64)
 
             # Use last 12 points or all if less
             train_size = min(len(values), 12)
             train = values[-train_size:]
 
-            try:
-                model = ExponentialSmoothing(
-                    train,
-                    seasonal_periods=4,
-                    trend='add',
-                    seasonal='add'
+            # Holt-Winters needs two full seasons of complete data
+            if train_size >= 2 * SEASONAL_PERIODS and np.isfinite(train).all():
+                forecast = holt_winters_additive(
+                    train, SEASONAL_PERIODS, FORECAST_STEPS, SMOOTHING_GRID
                 )
-                fitted = model.fit()
-                forecast = fitted.forecast(steps=3)
 
                 return {
-                    'forecast_values': [float(v) for v in forecast],
-                    'last_actual': float(values[-1]),
+                    'forecast_values': forecast,
+                    'last_actual': values[-1],
                     'target_column': target_col
                 }
-            except:
-                # Fallback to simple moving average if exponential smoothing fails
-                forecast_value = float(np.mean(train))
-                return {
-                    'forecast_values': [forecast_value] * 3,
-                    'last_actual': float(values[-1]),
-                    'target_column': target_col,
-                    'method': 'simple_average'
-                }
+
+            # Fallback to simple moving average for short or incomplete series
+            forecast_value = np.mean(train)
+            return {
+                'forecast_values': [forecast_value] * FORECAST_STEPS,
+                'last_actual': values[-1],
+                'target_column': target_col,
+                'method': 'simple_average'
+            }
 
         else:
             raise ValueError(f"Unknown operation: {operation}")
 
+    def _group_codes(self, df: pd.DataFrame, group_by: List[str]) -> Tuple[np.ndarray, pd.Index]:
+        """The table's cached grouping, narrowed to the rows of df"""
+        codes, keys = self.table.grouping(group_by)
+        if df is not self.table.df:
+            # Filtered frames are take()s of the table, whose RangeIndex
+            # labels are row positions
+            codes = codes[df.index.to_numpy()]
+        return codes, keys
+
+    def _grouped_aggregate(
+        self,
+        df: pd.DataFrame,
+        group_by: List[str],
+        target_col: str,
+        method: str
+    ) -> pd.Series:
+        """Grouped reduction of target_col, run by the group_reduce kernel when numba is available"""
+        codes, keys = self._group_codes(df, group_by)
+        grouped = codes >= 0
+        target = df[target_col]
+
+        if (
+            not NUMBA_AVAILABLE
+            or not pd.api.types.is_numeric_dtype(target.dtype)
+            or pd.api.types.is_bool_dtype(target.dtype)
+        ):
+            result = getattr(target[grouped].groupby(codes[grouped]), method)()
+        else:
+            # One pass of the NaN-aware kernel over float64 values; groups
+            # with no rows in df are dropped, as groupby would
+            statistic = _group_statistic(
+                method,
+                codes,
+                target.to_numpy(dtype=np.float64, na_value=np.nan),
+                len(keys)
+            )
+            present = np.flatnonzero(np.bincount(codes[grouped], minlength=len(keys)))
+            result = pd.Series(statistic[present], index=present, name=target_col)
+
+        # Label the result with the group keys instead of their codes
+        result.index = keys.take(result.index.to_numpy())
+
+        # Integer columns keep integer sums/minimums/maximums
+        if (
+            method in ('sum', 'min', 'max')
+            and pd.api.types.is_integer_dtype(target.dtype)
+            and not result.isna().any()
+        ):
+            result = result.astype(np.int64)
+
+        return result
+
     def _generate_chart(self, df: pd.DataFrame, plan: Dict[str, Any]) -> Optional[str]:
         """Generate chart and return as base64 encoded image"""
         chart_type = plan.get('chart_type')
@@ -261,68 +757,116 @@ class ExecutionEngine:
             return None
 
         try:
-            plt.figure(figsize=(10, 6))
-
-            if chart_type == 'line':
-                x_col = plan.get('x_axis')
-                y_col = plan.get('y_axis') or plan.get('target_column')
-                if x_col and y_col:
-                    plt.plot(df[x_col], df[y_col])
-                    plt.xlabel(x_col)
-                    plt.ylabel(y_col)
-
-            elif chart_type == 'bar':
-                x_col = plan.get('x_axis')
-                y_col = plan.get('y_axis') or plan.get('target_column')
-                if x_col and y_col:
-                    if plan.get('group_by'):
-                        grouped = df.groupby(x_col)[y_col].mean()
-                        grouped.plot(kind='bar')
-                    else:
-                        plt.bar(df[x_col], df[y_col])
-                    plt.xlabel(x_col)
-                    plt.ylabel(y_col)
-
-            elif chart_type == 'scatter':
-                x_col = plan.get('x_axis')
-                y_col = plan.get('y_axis')
-                if x_col and y_col:
-                    plt.scatter(df[x_col], df[y_col], alpha=0.5)
-                    plt.xlabel(x_col)
-                    plt.ylabel(y_col)
-
-            elif chart_type == 'histogram':
-                target_col = plan.get('target_column')
-                if target_col:
-                    plt.hist(df[target_col], bins=30, edgecolor='black')
-                    plt.xlabel(target_col)
-                    plt.ylabel('Frequency')
-
-            elif chart_type == 'box':
-                target_col = plan.get('target_column')
-                if target_col:
-                    plt.boxplot(df[target_col])
-                    plt.ylabel(target_col)
-
-            elif chart_type == 'heatmap':
-                # Correlation heatmap of numeric columns
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                if len(numeric_cols) > 1:
-                    corr_matrix = df[numeric_cols].corr()
-                    sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0)
-
-            plt.title(f"{plan['operation'].title()} - {chart_type.title()} Chart")
-            plt.tight_layout()
-
-            # Convert to base64
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=100)
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.read()).decode()
-            plt.close()
-
+            # One shared figure: render and encode under the lock
+            with _CHART_LOCK:
+                _CHART_FIGURE.clear()
+                ax = _CHART_FIGURE.add_subplot()
+
+                if chart_type == 'line':
+                    x_col = plan.get('x_axis')
+                    y_col = plan.get('y_axis') or plan.get('target_column')
+                    if x_col and y_col:
+                        points = df[[x_col, y_col]].dropna()
+                        ax.plot(_plot_values(points[x_col]), _plot_values(points[y_col]))
+                        ax.set_xlabel(x_col)
+                        ax.set_ylabel(y_col)
+
+                elif chart_type == 'bar':
+                    x_col = plan.get('x_axis')
+                    y_col = plan.get('y_axis') or plan.get('target_column')
+                    if x_col and y_col:
+                        if plan.get('group_by'):
+                            grouped = df.groupby(x_col)[y_col].mean()
+                            grouped.plot(kind='bar', ax=ax)
+                        else:
+                            points = df[[x_col, y_col]].dropna()
+                            ax.bar(_plot_values(points[x_col]), _plot_values(points[y_col]))
+                        ax.set_xlabel(x_col)
+                        ax.set_ylabel(y_col)
+
+                elif chart_type == 'scatter':
+                    x_col = plan.get('x_axis')
+                    y_col = plan.get('y_axis')
+                    if x_col and y_col:
+                        points = df[[x_col, y_col]].dropna()
+                        ax.scatter(
+                            _plot_values(points[x_col]), _plot_values(points[y_col]), alpha=0.5
+                        )
+                        ax.set_xlabel(x_col)
+                        ax.set_ylabel(y_col)
+
+                elif chart_type == 'histogram':
+                    target_col = plan.get('target_column')
+                    if target_col:
+                        ax.hist(_plot_values(df[target_col].dropna()), bins=30, edgecolor='black')
+                        ax.set_xlabel(target_col)
+                        ax.set_ylabel('Frequency')
+
+                elif chart_type == 'box':
+                    target_col = plan.get('target_column')
+                    if target_col:
+                        ax.boxplot(_plot_values(df[target_col].dropna()))
+                        ax.set_ylabel(target_col)
+
+                elif chart_type == 'heatmap':
+                    # Correlation heatmap of numeric columns
+                    numeric_cols = df.select_dtypes(include=[np.number]).columns
+                    if len(numeric_cols) > 1:
+                        corr = _correlation_matrix(df, numeric_cols)
+                        image = ax.imshow(corr, cmap='coolwarm', vmin=-1, vmax=1)
+                        _CHART_FIGURE.colorbar(image, ax=ax)
+
+                        ticks = np.arange(len(numeric_cols))
+                        ax.set_xticks(ticks, labels=numeric_cols, rotation=90)
+                        ax.set_yticks(ticks, labels=numeric_cols)
+
+                        # Annotate each cell, light text on the saturated ends
+                        for i, j in np.ndindex(corr.shape):
+                            if not np.isnan(corr[i, j]):
+                                ax.text(
+                                    j, i, f'{corr[i, j]:.2g}',
+                                    ha='center', va='center',
+                                    color='white' if abs(corr[i, j]) > 0.6 else 'black'
+                                )
+
+                ax.set_title(f"{plan['operation'].title()} - {chart_type.title()} Chart")
+                _CHART_FIGURE.tight_layout()
+
+                # Render, then encode the RGBA buffer with Pillow at a low zlib level
+                canvas = _CHART_FIGURE.canvas
+                canvas.draw()
+                buffer = io.BytesIO()
+                Image.frombuffer(
+                    'RGBA', canvas.get_width_height(), canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1
+                ).convert('RGB').save(buffer, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
+
+            image_base64 = base64.b64encode(buffer.getvalue()).decode()
             return f"data:image/png;base64,{image_base64}"
 
         except Exception as e:
-            print(f"Chart generation failed: {e}")
+            logger.exception("Chart generation failed: %s", e)
             return None
+
+
+def warm_up_numba() -> None:
+    """
+    Compile the grouped reduction kernel, the forecast kernel and the
+    masked reductions once at startup so the first request using them does
+    not pay the JIT cost.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    df = pd.DataFrame({'key': ['a', 'a', 'b'], 'value': [1.0, 2.0, 3.0]})
+    engine = ExecutionEngine(df)
+    for method in AGGREGATIONS.values():
+        engine._grouped_aggregate(df, ['key'], 'value', method)
+
+    holt_winters_additive(
+        np.arange(12, dtype=np.float64), SEASONAL_PERIODS, FORECAST_STEPS, SMOOTHING_GRID
+    )
+
+    values = np.ones(2, dtype=np.float64)
+    mask = np.ones(2, dtype=bool)
+    masked_reduce(values, mask)
+    masked_squared_deviation(values, mask, 1.0)
@@ -4,15 +4,53 @@ Provides REST API for execution plan validation and analytics execution.
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import os
-import json
+import io
+import threading
+import orjson
+import pandas as pd
+from collections import OrderedDict
 from pathlib import Path
 
 from .plan_validator import PlanValidator
-from .execution_engine import ExecutionEngine
+from .execution_engine import ExecutionEngine, NumpyTable, warm_up_numba
+
+# Execution results may carry NumPy values and non-string (grouped) keys
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson, so jsonify() and request.get_json()
+    serialize and parse in C, NumPy values included.
+    """
+
+    @staticmethod
+    def default(o):
+        # Reductions over Arrow-backed columns with no values give pd.NA
+        if o is pd.NA or o is pd.NaT:
+            return None
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand the encoded bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype
+        )
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Configuration
@@ -21,11 +59,82 @@ UPLOAD_FOLDER.mkdir(parents=True, exist_ok=True)
 
 # Service instances
 validator = PlanValidator()
-engine = ExecutionEngine()
+
+# Compile the numba groupby kernels before serving requests
+warm_up_numba()
 
 # Active session data (in production, use Redis or database)
 sessions = {}
 
+# Parsed data per session (DataFrame plus cached column arrays and groupings),
+# reused by every /execute call. Only the most recently used sessions stay in
+# memory; an evicted session is re-parsed from its CSV copy on next use.
+TABLE_CACHE_SIZE = int(os.getenv('WAKE_TABLE_CACHE_SIZE', 8))
+tables = OrderedDict()
+tables_lock = threading.Lock()
+
+# Threads writing each session's CSV copy to disk, removed once finished
+pending_writes = {}
+pending_writes_lock = threading.Lock()
+
+
+def _cache_table(session_id: str, table: NumpyTable) -> None:
+    """Store a session's table as most recently used, evicting the oldest over the limit"""
+    with tables_lock:
+        tables[session_id] = table
+        tables.move_to_end(session_id)
+        while len(tables) > TABLE_CACHE_SIZE:
+            tables.popitem(last=False)
+
+
+def _get_table(session_id: str) -> NumpyTable:
+    """The session's cached table, re-parsed from its CSV copy after eviction"""
+    with tables_lock:
+        table = tables.get(session_id)
+        if table is not None:
+            tables.move_to_end(session_id)
+            return table
+
+    _wait_for_csv_write(session_id)
+    engine = ExecutionEngine()
+    result = engine.load_csv(sessions[session_id]['file_path'])
+    if not result['success']:
+        raise ValueError(f"Could not reload session data: {result['error']}")
+    _cache_table(session_id, engine.table)
+    return engine.table
+
+
+def _write_csv_copy(session_id: str, file_path: Path, data: bytes) -> None:
+    """Write the session's CSV copy, then drop this writer from pending_writes"""
+    try:
+        file_path.write_bytes(data)
+    finally:
+        with pending_writes_lock:
+            if pending_writes.get(session_id) is threading.current_thread():
+                del pending_writes[session_id]
+
+
+def _start_csv_write(session_id: str, file_path: Path, data: bytes) -> None:
+    """
+    Write the CSV copy in the background. A re-upload under the same
+    session_id waits for the previous write, so the newest data lands last.
+    """
+    _wait_for_csv_write(session_id)
+    writer = threading.Thread(
+        target=_write_csv_copy, args=(session_id, file_path, data), daemon=True
+    )
+    with pending_writes_lock:
+        pending_writes[session_id] = writer
+    writer.start()
+
+
+def _wait_for_csv_write(session_id: str) -> None:
+    """Block until the session's pending CSV write, if any, has finished"""
+    with pending_writes_lock:
+        writer = pending_writes.get(session_id)
+    if writer is not None:
+        writer.join()
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -59,12 +168,12 @@ def upload_csv():
         # Generate session ID
         session_id = request.form.get('session_id') or os.urandom(16).hex()
 
-        # Save file
         file_path = UPLOAD_FOLDER / f"{session_id}.csv"
-        file.save(str(file_path))
 
-        # Load and analyze CSV
-        result = engine.load_csv(str(file_path))
+        # Parse the uploaded bytes in memory instead of re-reading a saved copy
+        data = file.read()
+        engine = ExecutionEngine()
+        result = engine.load_csv(io.BytesIO(data))
 
         if result['success']:
             # Store session info
@@ -74,6 +183,10 @@ def upload_csv():
                 'column_types': result['column_types'],
                 'row_count': result['row_count']
             }
+            _cache_table(session_id, engine.table)
+
+            # Keep a disk copy of the CSV, written while the response is sent
+            _start_csv_write(session_id, file_path, data)
 
             return jsonify({
                 'success': True,
@@ -178,15 +291,11 @@ def execute_plan():
                 'clarification_question': plan.get('clarification_question')
             }), 400
 
-        # Load CSV for this session
+        # Bind an engine to the data parsed at upload time; the shared frame
+        # is never modified, so concurrent requests can read it
         session = sessions[session_id]
-        load_result = engine.load_csv(session['file_path'])
-
-        if not load_result['success']:
-            return jsonify({
-                'success': False,
-                'error': f"Failed to load CSV: {load_result['error']}"
-            }), 500
+        table = _get_table(session_id)
+        engine = ExecutionEngine(table.df, session['column_types'], table)
 
         # Execute the plan
         result = engine.execute_plan(plan)
@@ -223,7 +332,9 @@ def delete_session(session_id):
         return jsonify({'error': 'Session not found'}), 404
 
     try:
-        # Delete file
+        # Delete file (once its background write has finished)
+        _wait_for_csv_write(session_id)
+
         session = sessions[session_id]
         file_path = Path(session['file_path'])
         if file_path.exists():
@@ -231,6 +342,8 @@ def delete_session(session_id):
 
         # Remove session
         del sessions[session_id]
+        with tables_lock:
+            tables.pop(session_id, None)  # drops its cached arrays and groupings
 
         return jsonify({'success': True})
 
@@ -23,6 +23,9 @@ class PlanValidator:
         'correlation', 'regression', 'forecast'
     }
 
+    # Operations that may reduce several target columns in one plan
+    MULTI_TARGET_OPERATIONS = {'mean', 'sum', 'min', 'max', 'std'}
+
     VALID_OPERATORS = {'==', '!=', '>', '<', '>=', '<='}
 
     VALID_CHART_TYPES = {
@@ -70,6 +73,21 @@ class PlanValidator:
             elif not all(isinstance(col, str) for col in plan['group_by']):
                 errors.append("All 'group_by' elements must be strings")
 
+        # Validate target_column (aggregations accept a list of columns)
+        if 'target_column' in plan and plan['target_column'] is not None:
+            target_column = plan['target_column']
+            if isinstance(target_column, list):
+                if not target_column or not all(isinstance(col, str) for col in target_column):
+                    errors.append("'target_column' array must contain one or more strings")
+                elif plan.get('operation') not in self.MULTI_TARGET_OPERATIONS:
+                    errors.append(
+                        f"Operation '{plan.get('operation')}' requires a single target_column"
+                    )
+                elif plan.get('chart_type'):
+                    errors.append("'chart_type' requires a single target_column")
+            elif not isinstance(target_column, str):
+                errors.append("'target_column' must be a string or an array of strings")
+
         # Validate chart_type
         if 'chart_type' in plan:
             if plan['chart_type'] not in self.VALID_CHART_TYPES:
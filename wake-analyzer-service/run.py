@@ -1,19 +1,35 @@
 #!/usr/bin/env python3
 """Wake Analyzer Service Entry Point"""
 
-from app.main import app
 import os
 
 if __name__ == '__main__':
     port = int(os.getenv('WAKE_ANALYZER_PORT', 5000))
     debug = os.getenv('FLASK_ENV') == 'development'
+    threads = int(os.getenv('WAKE_ANALYZER_THREADS', os.cpu_count() or 4))
 
     print(f"🚀 Starting Wake Analyzer Service on port {port}")
     print(f"📊 Upload folder: {os.getenv('UPLOAD_FOLDER', '/tmp/wake-analyzer-uploads')}")
     print(f"🔍 Debug mode: {debug}")
 
-    app.run(
-        host='0.0.0.0',
-        port=port,
-        debug=debug
-    )
+    if debug:
+        from app.main import app
+
+        app.run(
+            host='0.0.0.0',
+            port=port,
+            debug=debug
+        )
+    else:
+        # Sessions and their DataFrames live in process memory, so production
+        # runs one gunicorn worker and gets concurrency from its thread pool
+        # (CSV parsing, NumPy and the numba kernels release the GIL)
+        print(f"🧵 Worker threads: {threads}")
+        os.execvp('gunicorn', [
+            'gunicorn',
+            '--workers', '1',
+            '--worker-class', 'gthread',
+            '--threads', str(threads),
+            '--bind', f'0.0.0.0:{port}',
+            'app.main:app'
+        ])
@@ -0,0 +1,134 @@
+"""
+Regression tests for the Execution Engine
+"""
+
+import io
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.execution_engine import ExecutionEngine
+
+
+@pytest.fixture
+def engine():
+    df = pd.DataFrame({
+        'region': ['North', 'North', 'South', 'South'],
+        'sales': [1200.5, 1500.75, np.nan, np.nan],
+    })
+    return ExecutionEngine(df)
+
+
+@pytest.mark.parametrize('operation', ['mean', 'min', 'max', 'std'])
+def test_grouped_aggregate_all_nan_group(engine, operation):
+    response = engine.execute_plan({
+        'operation': operation,
+        'target_column': 'sales',
+        'group_by': ['region'],
+    })
+
+    assert response['success'], response
+    expected = getattr(engine.df.groupby('region')['sales'], operation)()
+    assert response['result'].keys() == {'North', 'South'}
+    assert response['result']['North'] == pytest.approx(expected['North'])
+    assert math.isnan(response['result']['South'])
+
+
+def test_grouped_sum_all_nan_group_is_zero(engine):
+    response = engine.execute_plan({
+        'operation': 'sum',
+        'target_column': 'sales',
+        'group_by': ['region'],
+    })
+
+    assert response['success'], response
+    assert response['result'] == {'North': pytest.approx(2701.25), 'South': 0.0}
+
+
+@pytest.mark.parametrize('operation', ['mean', 'sum', 'std'])
+def test_list_target_matches_single_targets(operation):
+    df = pd.DataFrame({
+        'sales': np.arange(1000, dtype=np.float64),
+        'units': np.arange(1000, dtype=np.float64) % 7,
+    })
+    engine = ExecutionEngine(df)
+    filters = [{'column': 'sales', 'operator': '>', 'value': 250}]
+
+    combined = engine.execute_plan({
+        'operation': operation,
+        'target_column': ['sales', 'units'],
+        'filters': filters,
+    })
+
+    assert combined['success'], combined
+    for column in ('sales', 'units'):
+        single = engine.execute_plan({
+            'operation': operation,
+            'target_column': column,
+            'filters': filters,
+        })
+        assert combined['result'][column] == pytest.approx(single['result'])
+
+
+@pytest.mark.parametrize('chart_type', ['histogram', 'box', 'line', 'bar', 'scatter'])
+def test_chart_on_column_with_missing_values(chart_type):
+    engine = ExecutionEngine()
+    loaded = engine.load_csv(io.BytesIO(
+        b'date,region,sales,units\n'
+        b'2024-01-01,North,1200,40\n'
+        b'2024-01-02,,,35\n'
+        b'2024-01-03,South,1300,\n'
+        b',East,1250,38\n'
+    ))
+    assert loaded['success'], loaded
+
+    response = engine.execute_plan({
+        'operation': 'mean',
+        'target_column': 'sales',
+        'x_axis': 'units' if chart_type == 'scatter' else 'date',
+        'y_axis': 'sales',
+        'chart_type': chart_type,
+    })
+
+    assert response['success'], response
+    assert response['chart'].startswith('data:image/png;base64,')
+
+
+def test_load_csv_types_column_from_all_rows():
+    csv = b'id,score\n' + b''.join(b'%d,%d\n' % (i, i) for i in range(200)) + b'200,2.5\n'
+    engine = ExecutionEngine()
+    loaded = engine.load_csv(io.BytesIO(csv))
+
+    assert loaded['success'], loaded
+    assert loaded['column_types']['score'].startswith('float')
+    assert loaded['row_count'] == 201
+
+
+def test_load_csv_keeps_full_precision_by_default():
+    engine = ExecutionEngine()
+    loaded = engine.load_csv(io.BytesIO(b'units,price\n40,1200.123456789\n35,1500.987654321\n'))
+
+    assert loaded['success'], loaded
+    assert loaded['column_types'] == {'units': 'int64', 'price': 'float64'}
+    response = engine.execute_plan({'operation': 'sum', 'target_column': 'price'})
+    assert response['result'] == pytest.approx(2701.11111111)
+
+
+@pytest.mark.parametrize('operation, expected', [('sum', 105), ('min', 30), ('max', 40)])
+@pytest.mark.parametrize('chart_type', [None, 'histogram'])
+def test_filtered_integer_reduction_stays_integer(operation, expected, chart_type):
+    engine = ExecutionEngine()
+    engine.load_csv(io.BytesIO(b'region,units\nN,30\nN,35\nN,40\nS,20\n'))
+
+    response = engine.execute_plan({
+        'operation': operation,
+        'target_column': 'units',
+        'filters': [{'column': 'region', 'operator': '==', 'value': 'N'}],
+        'chart_type': chart_type,
+    })
+
+    assert response['success'], response
+    assert response['result'] == expected
+    assert type(response['result']) is int
@@ -0,0 +1,66 @@
+"""
+Regression tests for the Flask API
+"""
+
+import io
+
+import pytest
+
+from app.main import _wait_for_csv_write, app, pending_writes, sessions, tables
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def upload(client, csv: bytes) -> str:
+    response = client.post('/upload', data={'file': (io.BytesIO(csv), 'data.csv')})
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()['session_id']
+
+
+def test_execute_serializes_missing_reduction_as_null(client):
+    session_id = upload(client, b'region,sales\nN,\nN,\nS,900\n')
+
+    response = client.post('/execute', json={
+        'session_id': session_id,
+        'plan': {
+            'operation': 'mean',
+            'target_column': 'sales',
+            'filters': [{'column': 'region', 'operator': '==', 'value': 'N'}],
+            'chart_type': 'histogram',
+        },
+    })
+
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.get_json()['result'] is None
+
+
+def test_reupload_writes_newest_copy_and_forgets_writer(client):
+    session_id = upload(client, b'sales\n1\n')
+    client.post('/upload', data={
+        'file': (io.BytesIO(b'sales\n2\n'), 'data.csv'),
+        'session_id': session_id,
+    })
+    _wait_for_csv_write(session_id)
+
+    with open(sessions[session_id]['file_path'], 'rb') as f:
+        assert f.read() == b'sales\n2\n'
+    assert session_id not in pending_writes
+
+
+def test_evicted_session_is_reparsed_from_disk(client, monkeypatch):
+    monkeypatch.setattr('app.main.TABLE_CACHE_SIZE', 1)
+    first = upload(client, b'sales\n1\n2\n')
+    upload(client, b'sales\n5\n')
+    assert first not in tables
+
+    response = client.post('/execute', json={
+        'session_id': first,
+        'plan': {'operation': 'sum', 'target_column': 'sales'},
+    })
+
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.get_json()['result'] == 3
+    assert list(tables) == [first]
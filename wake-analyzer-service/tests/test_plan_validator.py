@@ -0,0 +1,26 @@
+"""
+Regression tests for the Plan Validator
+"""
+
+from app.plan_validator import PlanValidator
+
+
+def test_list_target_with_chart_is_rejected():
+    validation = PlanValidator().validate_plan({
+        'operation': 'mean',
+        'target_column': ['sales', 'units'],
+        'chart_type': 'histogram',
+    })
+
+    assert not validation.valid
+    assert "'chart_type' requires a single target_column" in validation.errors
+
+
+def test_list_target_without_chart_is_valid():
+    validation = PlanValidator().validate_plan({
+        'operation': 'mean',
+        'target_column': ['sales', 'units'],
+        'chart_type': None,
+    })
+
+    assert validation.valid, validation.errors